@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -32,17 +33,21 @@ def setup_virtual_environment():
     else:
         print(f"    source {activate_script}")
 
+def get_installer():
+    """Return the install command, preferring uv's parallel installer when available."""
+    if shutil.which('uv'):
+        return ['uv', 'pip', 'install', '--python', sys.executable]
+    return [sys.executable, '-m', 'pip', 'install', '--prefer-binary']
+
 def install_dependencies():
     """Install project dependencies."""
+    installer = get_installer()
+    
     print("Installing dependencies...")
-    subprocess.run([
-        sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'
-    ], check=True)
+    subprocess.run(installer + ['-r', 'requirements.txt'], check=True)
     
     print("Installing project in development mode...")
-    subprocess.run([
-        sys.executable, '-m', 'pip', 'install', '-e', '.'
-    ], check=True)
+    subprocess.run(installer + ['-e', '.'], check=True)
 
 def create_directories():
     """Create necessary project directories."""
@@ -1,5 +1,9 @@
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
+README = Path(__file__).parent / "README.md"
+
 setup(
     name="outcome-tracker",
     version="0.1.0",
@@ -9,7 +13,6 @@ setup(
         "pandas>=2.1.0",
         "numpy>=1.24.0",
         "plotly>=5.18.0",
-        "scikit-learn>=1.3.0",
         "sqlalchemy>=2.0.0",
         "python-dotenv>=1.0.0",
     ],
@@ -23,7 +26,7 @@ setup(
     python_requires=">=3.8",
     author="Your Name",
     description="A web-based application for tracking neurodiverse intervention outcomes",
-    long_description=open("README.md").read(),
+    long_description=README.read_text(encoding="utf-8") if README.exists() else "",
     long_description_content_type="text/markdown",
     classifiers=[
         "Development Status :: 3 - Alpha",
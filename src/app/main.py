@@ -1,21 +1,13 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from pathlib import Path
-import sys
 from datetime import datetime
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from database.models import init_db, Session
-from database.crud import add_assessment, get_assessments, get_assessment
-from utils.data_processing import (
-    process_assessment_data,
+from src.database.models import init_db
+from src.database.crud import add_assessment, get_assessments_df
+from src.utils.data_processing import (
+    bin_ages,
     calculate_summary_stats,
     calculate_progress,
+    frame_fingerprint,
     generate_trend_data,
     identify_areas_of_concern
 )
@@ -94,13 +86,25 @@ def render_data_entry():
                 }
                 
                 add_assessment(assessment_data)
+                load_assessments_df.clear()
                 st.success("Assessment data saved successfully!")
                 
             except Exception as e:
                 st.error(f"Error saving assessment: {str(e)}")
 
+# Cached figures are keyed on a content hash of only the columns each plot draws
+PLOT_CACHE_ENTRIES = 16
+TREND_PLOT_COLUMNS = ['assessment_date', 'social_score', 'communication_score', 'behavior_score']
+AGE_PLOT_COLUMNS = ['age_group', 'social_score', 'communication_score', 'behavior_score']
+
+@st.cache_data(
+    max_entries=PLOT_CACHE_ENTRIES,
+    hash_funcs={"pandas.core.frame.DataFrame": lambda df: frame_fingerprint(df, TREND_PLOT_COLUMNS)}
+)
 def create_score_trend_plot(df):
     """Create a line plot showing score trends over time."""
+    import plotly.graph_objects as go
+
     fig = go.Figure()
     
     metrics = {
@@ -131,8 +135,11 @@ def create_score_trend_plot(df):
     
     return fig
 
+@st.cache_data(max_entries=PLOT_CACHE_ENTRIES)
 def create_radar_chart(latest_scores):
     """Create a radar chart showing the latest scores."""
+    import plotly.graph_objects as go
+
     categories = ['Social Interaction', 'Communication', 'Behavior']
     values = [
         latest_scores['social_score'],
@@ -160,14 +167,14 @@ def create_radar_chart(latest_scores):
     
     return fig
 
+@st.cache_data(
+    max_entries=PLOT_CACHE_ENTRIES,
+    hash_funcs={"pandas.core.frame.DataFrame": lambda df: frame_fingerprint(df, AGE_PLOT_COLUMNS)}
+)
 def create_age_distribution_plot(df):
     """Create a box plot showing score distributions by age group."""
-    df['age_group'] = pd.cut(
-        df['age'],
-        bins=[0, 5, 10, 15, 18],
-        labels=['0-5', '6-10', '11-15', '16-18']
-    )
-    
+    import plotly.graph_objects as go
+
     fig = go.Figure()
     
     metrics = {
@@ -194,30 +201,36 @@ def create_age_distribution_plot(df):
     
     return fig
 
+@st.cache_data(ttl=60)
+def load_assessments_df():
+    """Fetch all assessments as a DataFrame with age groups assigned."""
+    df = get_assessments_df()
+    df['age_group'] = bin_ages(df['age'])
+    return df
+
+@st.cache_data
+def cached_summary_stats(df):
+    """Cache summary statistics across reruns with unchanged data."""
+    return calculate_summary_stats(df)
+
+@st.cache_data
+def cached_areas_of_concern(df):
+    """Cache areas of concern across reruns with unchanged data."""
+    return identify_areas_of_concern(df)
+
 def render_analytics():
     """Render the analytics dashboard."""
     st.header("Analytics Dashboard")
     
     # Get all assessments
-    assessments = get_assessments()
-    if not assessments:
+    df = load_assessments_df()
+    if df.empty:
         st.warning("No assessment data available.")
         return
     
-    # Process data
-    df = process_assessment_data([{
-        'child_id': a.child_id,
-        'age': a.age,
-        'assessment_date': a.assessment_date,
-        'social_score': a.social_score,
-        'communication_score': a.communication_score,
-        'behavior_score': a.behavior_score,
-        'notes': a.notes
-    } for a in assessments])
-    
     # Summary statistics
     st.subheader("Summary Statistics")
-    stats = calculate_summary_stats(df)
+    stats = cached_summary_stats(df)
     
     col1, col2, col3 = st.columns(3)
     
@@ -264,7 +277,7 @@ def render_analytics():
     
     # Areas of concern
     st.subheader("Areas of Concern")
-    concerns = identify_areas_of_concern(df)
+    concerns = cached_areas_of_concern(df)
     if concerns:
         for concern in concerns:
             st.warning(
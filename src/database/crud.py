@@ -1,9 +1,16 @@
+from __future__ import annotations
+
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+# Resolve models at call time so importing this module does not load SQLAlchemy
+from . import models
 
-from .models import Session, Assessment
+if TYPE_CHECKING:
+    import pandas as pd
+    from .models import Assessment
 
-def add_assessment(data: Dict) -> Assessment:
+def add_assessment(data: Dict) -> int:
     """
     Add a new assessment to the database.
     
@@ -11,21 +18,59 @@ def add_assessment(data: Dict) -> Assessment:
         data (Dict): Dictionary containing assessment data
         
     Returns:
-        Assessment: Created assessment object
+        int: ID of the created assessment
     """
-    with Session() as session:
-        assessment = Assessment(
+    session = models.Session()
+    try:
+        assessment = models.Assessment(
             child_id=data['child_id'],
             age=data['age'],
             social_score=data['social_score'],
             communication_score=data['communication_score'],
-            behavior_score=data['behavior_score'],
-            notes=data.get('notes', '')
+            behavior_score=data['behavior_score']
         )
+        if 'notes' in data:
+            assessment.notes = data['notes']
         session.add(assessment)
+        session.flush()
+        assessment_id = assessment.id
         session.commit()
-        session.refresh(assessment)
-        return assessment
+        return assessment_id
+    finally:
+        models.Session.remove()
+
+def add_assessments_bulk(data_list: List[Dict]) -> int:
+    """
+    Add multiple assessments to the database in a single transaction.
+    
+    Args:
+        data_list (List[Dict]): List of dictionaries containing assessment data
+        
+    Returns:
+        int: Number of assessments inserted
+    """
+    if not data_list:
+        return 0
+        
+    # Every row carries the same keys so the insert runs as a single executemany
+    now = datetime.utcnow()
+    rows = [{
+        'child_id': data['child_id'],
+        'age': data['age'],
+        'assessment_date': data.get('assessment_date') or now,
+        'social_score': data['social_score'],
+        'communication_score': data['communication_score'],
+        'behavior_score': data['behavior_score'],
+        'notes': data.get('notes', '')
+    } for data in data_list]
+    
+    session = models.Session()
+    try:
+        session.execute(models.Assessment.__table__.insert(), rows)
+        session.commit()
+        return len(rows)
+    finally:
+        models.Session.remove()
 
 def get_assessment(assessment_id: int) -> Optional[Assessment]:
     """
@@ -37,8 +82,11 @@ def get_assessment(assessment_id: int) -> Optional[Assessment]:
     Returns:
         Optional[Assessment]: Assessment object if found, None otherwise
     """
-    with Session() as session:
-        return session.query(Assessment).filter(Assessment.id == assessment_id).first()
+    session = models.Session()
+    try:
+        return session.query(models.Assessment).filter(models.Assessment.id == assessment_id).first()
+    finally:
+        models.Session.remove()
 
 def get_assessments(child_id: Optional[str] = None) -> List[Assessment]:
     """
@@ -50,11 +98,48 @@ def get_assessments(child_id: Optional[str] = None) -> List[Assessment]:
     Returns:
         List[Assessment]: List of assessment objects
     """
-    with Session() as session:
-        query = session.query(Assessment)
+    session = models.Session()
+    try:
+        query = session.query(models.Assessment)
         if child_id:
-            query = query.filter(Assessment.child_id == child_id)
-        return query.order_by(Assessment.assessment_date.desc()).all()
+            query = query.filter(models.Assessment.child_id == child_id)
+        return query.order_by(models.Assessment.assessment_date.desc()).all()
+    finally:
+        models.Session.remove()
+
+def get_assessments_df(child_id: Optional[str] = None) -> pd.DataFrame:
+    """
+    Retrieve assessments as a DataFrame, optionally filtered by child_id.
+    
+    Only the columns used for analysis are selected, so no ORM objects are built.
+    
+    Args:
+        child_id (Optional[str]): Child ID to filter by
+        
+    Returns:
+        pd.DataFrame: Assessment data ordered by most recent first
+    """
+    import pandas as pd
+    from sqlalchemy import select
+
+    query = select(
+        models.Assessment.child_id,
+        models.Assessment.age,
+        models.Assessment.assessment_date,
+        models.Assessment.social_score,
+        models.Assessment.communication_score,
+        models.Assessment.behavior_score,
+        models.Assessment.notes
+    )
+    if child_id:
+        query = query.where(models.Assessment.child_id == child_id)
+    query = query.order_by(models.Assessment.assessment_date.desc())
+    
+    session = models.Session()
+    try:
+        return pd.read_sql(query, session.connection(), parse_dates=['assessment_date'])
+    finally:
+        models.Session.remove()
 
 def update_assessment(assessment_id: int, data: Dict) -> Optional[Assessment]:
     """
@@ -67,8 +152,9 @@ def update_assessment(assessment_id: int, data: Dict) -> Optional[Assessment]:
     Returns:
         Optional[Assessment]: Updated assessment object if found, None otherwise
     """
-    with Session() as session:
-        assessment = session.query(Assessment).filter(Assessment.id == assessment_id).first()
+    session = models.Session()
+    try:
+        assessment = session.query(models.Assessment).filter(models.Assessment.id == assessment_id).first()
         if assessment:
             for key, value in data.items():
                 if hasattr(assessment, key):
@@ -77,6 +163,8 @@ def update_assessment(assessment_id: int, data: Dict) -> Optional[Assessment]:
             session.commit()
             session.refresh(assessment)
         return assessment
+    finally:
+        models.Session.remove()
 
 def delete_assessment(assessment_id: int) -> bool:
     """
@@ -88,10 +176,13 @@ def delete_assessment(assessment_id: int) -> bool:
     Returns:
         bool: True if assessment was deleted, False otherwise
     """
-    with Session() as session:
-        assessment = session.query(Assessment).filter(Assessment.id == assessment_id).first()
+    session = models.Session()
+    try:
+        assessment = session.query(models.Assessment).filter(models.Assessment.id == assessment_id).first()
         if assessment:
             session.delete(assessment)
             session.commit()
             return True
-        return False
\ No newline at end of file
+        return False
+    finally:
+        models.Session.remove()
\ No newline at end of file
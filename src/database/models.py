@@ -1,45 +1,115 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 import os
+import threading
 
-# Create SQLite database engine
+# SQLite database location
 DATABASE_URL = "sqlite:///data/outcomes.db"
-engine = create_engine(DATABASE_URL)
 
-# Create declarative base
-Base = declarative_base()
+# Names built on first access so importing this module does not pull in SQLAlchemy
+_LAZY_NAMES = ('engine', 'Base', 'Assessment', 'Session')
 
-class Assessment(Base):
-    """Model for storing assessment data."""
-    __tablename__ = 'assessments'
+# Streamlit runs each session in its own thread, so the first loads can race
+_load_lock = threading.Lock()
 
-    id = Column(Integer, primary_key=True)
-    child_id = Column(String(50), nullable=False)
-    assessment_date = Column(DateTime, default=datetime.utcnow)
-    age = Column(Integer, nullable=False)
-    
-    # Assessment scores
-    social_score = Column(Float)
-    communication_score = Column(Float)
-    behavior_score = Column(Float)
-    
-    # Additional fields
-    notes = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+# Set once init_db has created the schema in this process
+_db_initialized = False
+
+
+def _load():
+    """Build the SQLAlchemy objects once, however many threads ask at the same time."""
+    # _build assigns Session last, so once it exists everything else does too
+    if 'Session' in globals():
+        return
+
+    with _load_lock:
+        if 'Session' not in globals():
+            _build()
+
+
+def _build():
+    """Import SQLAlchemy and build the engine, models and session factory."""
+    global engine, Base, Assessment, Session
+
+    from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, Text, Index
+    from sqlalchemy.ext.declarative import declarative_base
+    from sqlalchemy.orm import scoped_session, sessionmaker
+
+    # Create SQLite database engine, shared across Streamlit script threads
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        pool_pre_ping=True
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL journaling and relaxed syncing on every new connection."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
+    # Create declarative base
+    Base = declarative_base()
+
+    class Assessment(Base):
+        """Model for storing assessment data."""
+        __tablename__ = 'assessments'
+        __table_args__ = (
+            Index('ix_child_date', 'child_id', 'assessment_date'),
+            Index('ix_assessment_date', 'assessment_date'),
+        )
+
+        id = Column(Integer, primary_key=True)
+        child_id = Column(String(50), nullable=False)
+        assessment_date = Column(DateTime, default=datetime.utcnow)
+        age = Column(Integer, nullable=False)
+
+        # Assessment scores
+        social_score = Column(Float)
+        communication_score = Column(Float)
+        behavior_score = Column(Float)
+
+        # Additional fields
+        notes = Column(Text, default='')
+        created_at = Column(DateTime, default=datetime.utcnow)
+        updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Create thread-local Session registry
+    Session = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
+
+
+def __getattr__(name):
+    """Build the SQLAlchemy objects the first time one of them is requested."""
+    if name in _LAZY_NAMES:
+        _load()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Create Session class
-Session = sessionmaker(bind=engine)
 
 def init_db():
-    """Initialize the database, creating all tables."""
+    """Initialize the database, creating all tables once per process."""
+    global _db_initialized
+
+    if _db_initialized:
+        return
+
+    _load()
+
     # Ensure data directory exists
     os.makedirs('data', exist_ok=True)
-    
+
     # Create all tables
     Base.metadata.create_all(engine)
+    
+    # Add indexes missing from databases created before they were declared
+    for index in Assessment.__table__.indexes:
+        index.create(engine, checkfirst=True)
+    
+    _db_initialized = True
 
 if __name__ == '__main__':
-    init_db()
\ No newline at end of file
+    init_db()
@@ -1,8 +1,50 @@
-import pandas as pd
-import numpy as np
-from typing import Dict, List
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Union
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+SCORE_COLUMNS = ['social_score', 'communication_score', 'behavior_score']
+
+AGE_BINS = [0, 5, 10, 15, 20]
+AGE_LABELS = ['0-5', '6-10', '11-15', '16+']
+
+def frame_fingerprint(df: pd.DataFrame, columns: List[str]) -> tuple:
+    """
+    Build a content-derived cache key from the given columns of a DataFrame.
+    
+    Args:
+        df (pd.DataFrame): Assessment data DataFrame
+        columns (List[str]): Columns the cached result depends on
+        
+    Returns:
+        tuple: Hashable key that changes whenever those columns change
+    """
+    import pandas as pd
+
+    row_hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+    return (len(df), tuple(columns), digest)
+
+def bin_ages(ages: pd.Series) -> pd.Series:
+    """
+    Bin ages into the age groups used for analysis.
+    
+    Args:
+        ages (pd.Series): Ages in years
+        
+    Returns:
+        pd.Series: Categorical age group labels
+    """
+    import pandas as pd
+
+    return pd.cut(ages, bins=AGE_BINS, labels=AGE_LABELS)
+
 def process_assessment_data(assessments: List[Dict]) -> pd.DataFrame:
     """
     Convert assessment data to a pandas DataFrame and perform basic processing.
@@ -13,14 +55,36 @@ def process_assessment_data(assessments: List[Dict]) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Processed assessment data
     """
+    import numpy as np
+    import pandas as pd
+
     if not assessments:
         return pd.DataFrame()
         
-    df = pd.DataFrame(assessments)
+    # Gather each field into its own column in a single pass over the records
+    n = len(assessments)
+    columns = {}
+    for i, record in enumerate(assessments):
+        for key, value in record.items():
+            if key not in columns:
+                columns[key] = [None] * n
+            columns[key][i] = value
+            
+    # Scores are converted to typed arrays up front; missing values become NaN
+    for col in SCORE_COLUMNS:
+        if col in columns:
+            columns[col] = np.array(columns[col], dtype=np.float64)
+            
+    # Parse the gathered dates in one call rather than letting the DataFrame
+    # constructor infer the column and converting it afterwards
+    if 'assessment_date' in columns:
+        columns['assessment_date'] = pd.to_datetime(columns['assessment_date'])
+        
+    df = pd.DataFrame(columns, copy=False)
     
-    # Convert dates to datetime
-    if 'assessment_date' in df.columns:
-        df['assessment_date'] = pd.to_datetime(df['assessment_date'])
+    # Bin ages once so downstream analysis can group without re-binning
+    if 'age' in df.columns:
+        df['age_group'] = bin_ages(df['age'])
         
     return df
 
@@ -34,58 +98,173 @@ def calculate_summary_stats(df: pd.DataFrame) -> Dict:
     Returns:
         Dict: Dictionary containing summary statistics
     """
-    score_columns = ['social_score', 'communication_score', 'behavior_score']
+    score_columns = [
+        col for col in SCORE_COLUMNS
+        if col in df.columns
+    ]
+    if not score_columns:
+        return {}
+        
+    scores = _score_block(df, score_columns)
     
     summary = {}
-    for col in score_columns:
-        if col in df.columns:
-            summary[col] = {
-                'mean': df[col].mean(),
-                'median': df[col].median(),
-                'std': df[col].std(),
-                'min': df[col].min(),
-                'max': df[col].max()
-            }
-            
+    for i, col in enumerate(score_columns):
+        mean, median, std, minimum, maximum = _column_stats(scores[:, i])
+        summary[col] = {
+            'mean': float(mean),
+            'median': float(median),
+            'std': float(std),
+            'min': float(minimum),
+            'max': float(maximum)
+        }
+        
     return summary
 
-def calculate_progress(df: pd.DataFrame, child_id: str) -> Dict:
+def _score_block(df: pd.DataFrame, score_columns: List[str]) -> np.ndarray:
+    """Return a column-major float copy of the score columns, converting only non-float data."""
+    import numpy as np
+
+    # Selecting the columns builds a new array; asfortranarray leaves it alone when
+    # it is already column-major, so this costs one copy per call
+    scores = df[score_columns].to_numpy()
+    if scores.dtype.kind != 'f':
+        scores = scores.astype(np.float64)
+    return np.asfortranarray(scores)
+
+def _column_stats(values: np.ndarray) -> tuple:
+    """Return mean, median, sample std, min and max of one column, ignoring NaN."""
+    import numpy as np
+
+    # Compact out missing values once; every statistic then runs on a dense copy
+    values = values[~np.isnan(values)]
+    n = values.size
+    if n == 0:
+        return (np.nan,) * 5
+        
+    mean = values.sum(dtype=np.float64) / n
+    deviations = values - mean
+    std = np.sqrt(np.dot(deviations, deviations) / (n - 1)) if n > 1 else np.nan
+    minimum = values.min()
+    maximum = values.max()
+    
+    # The compacted copy is ours, so the median may partition it in place
+    median = np.median(values, overwrite_input=True)
+    
+    return mean, median, std, minimum, maximum
+
+@dataclass
+class AssessmentIndex:
+    """First and latest scores per child, for repeated progress lookups."""
+    first: Dict[str, Dict[str, float]]
+    last: Dict[str, Dict[str, float]]
+    counts: Dict[str, int]
+    score_columns: List[str]
+
+def build_assessment_index(df: pd.DataFrame) -> AssessmentIndex:
     """
-    Calculate progress over time for a specific child.
+    Index the first and latest assessment scores of every child.
     
     Args:
         df (pd.DataFrame): Assessment data DataFrame
-        child_id (str): Child ID to analyze
         
     Returns:
-        Dict: Dictionary containing progress metrics
+        AssessmentIndex: Per-child first and latest scores
     """
+    import numpy as np
+    import pandas as pd
+
+    score_columns = [
+        col for col in SCORE_COLUMNS
+        if col in df.columns
+    ]
     if df.empty:
-        return {}
+        return AssessmentIndex(first={}, last={}, counts={}, score_columns=score_columns)
         
-    child_data = df[df['child_id'] == child_id].sort_values('assessment_date')
+    # Sort rows by child, then date, so each child's assessments form one contiguous run;
+    # int32 codes narrow the sort key, and missing ids stay -1
+    codes, uniques = pd.factorize(df['child_id'])
+    codes = codes.astype(np.int32)
+    order = np.lexsort((df['assessment_date'].to_numpy(), codes))
+    order = order[codes[order] >= 0]
+    if order.size == 0:
+        return AssessmentIndex(first={}, last={}, counts={}, score_columns=score_columns)
+    sorted_codes = codes[order]
     
-    if child_data.empty:
-        return {}
-        
-    progress = {}
-    score_columns = ['social_score', 'communication_score', 'behavior_score']
+    # Run boundaries give each child's first and latest row and assessment count
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+    child_ids = np.asarray(uniques)[sorted_codes[starts]].tolist()
+    scores = _score_block(df, score_columns)
     
-    for col in score_columns:
-        if col in child_data.columns and len(child_data) >= 2:
-            initial = child_data[col].iloc[0]
-            current = child_data[col].iloc[-1]
-            change = current - initial
-            percent_change = (change / initial * 100) if initial != 0 else 0
+    return AssessmentIndex(
+        first={
+            child: dict(zip(score_columns, row))
+            for child, row in zip(child_ids, scores[order[starts]].tolist())
+        },
+        last={
+            child: dict(zip(score_columns, row))
+            for child, row in zip(child_ids, scores[order[ends - 1]].tolist())
+        },
+        counts=dict(zip(child_ids, (ends - starts).tolist())),
+        score_columns=score_columns
+    )
+
+def calculate_progress(df: Union[pd.DataFrame, AssessmentIndex], child_id: str) -> Dict:
+    """
+    Calculate progress over time for a specific child.
+    
+    Args:
+        df (Union[pd.DataFrame, AssessmentIndex]): Assessment data DataFrame, or an
+            index built from it with build_assessment_index for repeated lookups
+        child_id (str): Child ID to analyze
+        
+    Returns:
+        Dict: Dictionary containing progress metrics
+    """
+    if isinstance(df, AssessmentIndex):
+        if df.counts.get(child_id, 0) < 2:
+            return {}
             
+        progress = {}
+        for col in df.score_columns:
+            initial = df.first[child_id][col]
+            current = df.last[child_id][col]
+            change = current - initial
             progress[col] = {
                 'initial_score': initial,
                 'current_score': current,
                 'absolute_change': change,
-                'percent_change': percent_change
+                'percent_change': (change / initial * 100) if initial != 0 else 0
             }
-            
-    return progress
+        return progress
+        
+    if df.empty:
+        return {}
+        
+    child_data = df[df['child_id'] == child_id].sort_values('assessment_date', kind='stable')
+    score_columns = [
+        col for col in SCORE_COLUMNS
+        if col in child_data.columns
+    ]
+    
+    if len(child_data) < 2 or not score_columns:
+        return {}
+        
+    # Compare first and last assessments for all score columns at once
+    initial = child_data[score_columns].iloc[0]
+    current = child_data[score_columns].iloc[-1]
+    change = current - initial
+    percent_change = (change / initial * 100).where(initial != 0, 0)
+    
+    return {
+        col: {
+            'initial_score': initial[col],
+            'current_score': current[col],
+            'absolute_change': change[col],
+            'percent_change': percent_change[col]
+        }
+        for col in score_columns
+    }
 
 def generate_trend_data(df: pd.DataFrame, metric: str) -> Dict:
     """
@@ -106,14 +285,12 @@ def generate_trend_data(df: pd.DataFrame, metric: str) -> Dict:
     # Overall trend
     trends['overall'] = df.groupby('assessment_date')[metric].mean().to_dict()
     
-    # Trend by age group
-    df['age_group'] = pd.cut(df['age'], 
-                            bins=[0, 5, 10, 15, 20],
-                            labels=['0-5', '6-10', '11-15', '16+'])
+    # Trend by age group, binning here only for frames not built by process_assessment_data
+    age_groups = df['age_group'] if 'age_group' in df.columns else bin_ages(df['age'])
     
     trends['by_age_group'] = {
         str(group): group_data[metric].mean()
-        for group, group_data in df.groupby('age_group')
+        for group, group_data in df.groupby(age_groups, observed=False)
     }
     
     return trends
@@ -129,18 +306,37 @@ def identify_areas_of_concern(df: pd.DataFrame, threshold: float = 4.0) -> List[
     Returns:
         List[Dict]: List of identified concerns
     """
+    import numpy as np
+    import pandas as pd
+
+    score_columns = [
+        col for col in SCORE_COLUMNS
+        if col in df.columns
+    ]
+    if not score_columns:
+        return []
+        
+    scores = _score_block(df, score_columns)
+    codes, uniques = pd.factorize(df['child_id'])
+    
     concerns = []
-    score_columns = ['social_score', 'communication_score', 'behavior_score']
-    
-    for col in score_columns:
-        if col in df.columns:
-            low_scores = df[df[col] < threshold]
-            if not low_scores.empty:
-                concerns.append({
-                    'area': col.replace('_score', ''),
-                    'count': len(low_scores),
-                    'affected_children': low_scores['child_id'].nunique(),
-                    'average_score': low_scores[col].mean()
-                })
-                
+    for i, col in enumerate(score_columns):
+        # Each column is contiguous in the block; NaN scores never count as low
+        mask = scores[:, i] < threshold
+        low_scores = scores[:, i][mask]
+        if low_scores.size == 0:
+            continue
+            
+        # Mark children with a low score; missing child ids (code -1) are skipped
+        low_codes = codes[mask]
+        affected = np.zeros(len(uniques), dtype=bool)
+        affected[low_codes[low_codes >= 0]] = True
+        
+        concerns.append({
+            'area': col.replace('_score', ''),
+            'count': int(low_scores.size),
+            'affected_children': int(np.count_nonzero(affected)),
+            'average_score': float(low_scores.sum(dtype=np.float64) / low_scores.size)
+        })
+        
     return concerns
\ No newline at end of file
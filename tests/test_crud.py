@@ -0,0 +1,91 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+
+from src.database import models
+from src.database.crud import (
+    add_assessment,
+    add_assessments_bulk,
+    get_assessment,
+    get_assessments,
+    get_assessments_df
+)
+
+@pytest.fixture
+def test_db(tmp_path):
+    """Fixture binding the session registry to a fresh SQLite database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    models.Base.metadata.create_all(engine)
+    models.Session.remove()
+    models.Session.configure(bind=engine)
+    yield engine
+    models.Session.remove()
+    models.Session.configure(bind=models.engine)
+    engine.dispose()
+
+@pytest.fixture
+def assessment_data():
+    """Fixture providing a single assessment record."""
+    return {
+        'child_id': 'C001',
+        'age': 8,
+        'assessment_date': datetime(2024, 1, 1),
+        'social_score': 7.0,
+        'communication_score': 6.0,
+        'behavior_score': 8.0,
+        'notes': 'Initial assessment'
+    }
+
+def test_add_assessment_returns_id(test_db, assessment_data):
+    """Test that add_assessment returns the id of the stored row."""
+    assessment_id = add_assessment(assessment_data)
+    
+    assert isinstance(assessment_id, int)
+    stored = get_assessment(assessment_id)
+    assert stored.child_id == 'C001'
+    assert stored.notes == 'Initial assessment'
+    
+    del assessment_data['notes']
+    assert get_assessment(add_assessment(assessment_data)).notes == ''
+
+def test_add_assessments_bulk(test_db, assessment_data):
+    """Test bulk insertion keeps historical dates and defaults missing ones."""
+    undated = {k: v for k, v in assessment_data.items() if k not in ('assessment_date', 'notes')}
+    undated['child_id'] = 'C002'
+    historical = dict(assessment_data, assessment_date=datetime(2020, 1, 1))
+    
+    assert add_assessments_bulk([historical, undated]) == 2
+    
+    stored = {a.child_id: a for a in get_assessments()}
+    assert len(stored) == 2
+    assert stored['C001'].assessment_date == datetime(2020, 1, 1)
+    assert stored['C001'].notes == 'Initial assessment'
+    assert stored['C002'].assessment_date.year >= 2024
+    assert stored['C002'].notes == ''
+
+def test_add_assessments_bulk_empty(test_db):
+    """Test bulk insertion of an empty list."""
+    assert add_assessments_bulk([]) == 0
+    assert get_assessments() == []
+
+def test_get_assessments_df(test_db, assessment_data):
+    """Test DataFrame retrieval columns, ordering and child filtering."""
+    add_assessments_bulk([
+        assessment_data,
+        dict(assessment_data, assessment_date=datetime(2024, 2, 1)),
+        dict(assessment_data, child_id='C002')
+    ])
+    
+    df = get_assessments_df()
+    assert list(df.columns) == [
+        'child_id', 'age', 'assessment_date',
+        'social_score', 'communication_score', 'behavior_score', 'notes'
+    ]
+    assert len(df) == 3
+    assert df['child_id'].dtype == object
+    assert df['assessment_date'].dtype.kind == 'M'
+    assert df['assessment_date'].is_monotonic_decreasing
+    
+    child_df = get_assessments_df('C001')
+    assert len(child_df) == 2
+    assert set(child_df['child_id']) == {'C001'}
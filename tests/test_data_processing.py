@@ -6,10 +6,13 @@ from src.utils.data_processing import (
     process_assessment_data,
     calculate_summary_stats,
     calculate_progress,
-    identify_areas_of_concern
+    build_assessment_index,
+    generate_trend_data,
+    identify_areas_of_concern,
+    frame_fingerprint
 )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_assessments():
     """Fixture providing sample assessment data."""
     return [
@@ -42,6 +45,11 @@ def sample_assessments():
         }
     ]
 
+@pytest.fixture(scope="session")
+def sample_df(sample_assessments):
+    """Fixture providing the sample assessments processed once per session."""
+    return process_assessment_data(sample_assessments)
+
 def test_process_assessment_data(sample_assessments):
     """Test assessment data processing."""
     df = process_assessment_data(sample_assessments)
@@ -50,6 +58,7 @@ def test_process_assessment_data(sample_assessments):
     assert len(df) == 3
     assert 'assessment_date' in df.columns
     assert df['assessment_date'].dtype == 'datetime64[ns]'
+    assert list(df['age_group'].astype(str)) == ['6-10', '6-10', '6-10']
 
 def test_process_empty_assessment_data():
     """Test processing empty assessment data."""
@@ -57,10 +66,16 @@ def test_process_empty_assessment_data():
     assert isinstance(df, pd.DataFrame)
     assert df.empty
 
-def test_calculate_summary_stats(sample_assessments):
+def test_process_assessment_data_keeps_child_ids(sample_df):
+    """Test that child ids stay plain values, so filtered frames group only their own children."""
+    assert sample_df['child_id'].dtype == object
+    
+    filtered = sample_df[sample_df['child_id'] == 'C001']
+    assert list(filtered.groupby('child_id')['social_score'].mean().index) == ['C001']
+
+def test_calculate_summary_stats(sample_df):
     """Test summary statistics calculation."""
-    df = process_assessment_data(sample_assessments)
-    stats = calculate_summary_stats(df)
+    stats = calculate_summary_stats(sample_df)
     
     assert 'social_score' in stats
     assert 'communication_score' in stats
@@ -74,10 +89,37 @@ def test_calculate_summary_stats(sample_assessments):
     assert social_stats['min'] == 4.0
     assert social_stats['max'] == 8.0
 
-def test_calculate_progress(sample_assessments):
+def test_calculate_summary_stats_with_missing_scores():
+    """Test that missing scores are skipped and all-missing columns give NaN."""
+    df = process_assessment_data([
+        {'child_id': 'C001', 'social_score': 7.0, 'communication_score': None, 'behavior_score': None},
+        {'child_id': 'C002', 'social_score': None, 'communication_score': 5.0, 'behavior_score': None},
+        {'child_id': 'C003', 'social_score': 4.0, 'communication_score': 3.0, 'behavior_score': None}
+    ])
+    stats = calculate_summary_stats(df)
+    
+    social_stats = stats['social_score']
+    assert social_stats['mean'] == 5.5
+    assert social_stats['median'] == 5.5
+    assert social_stats['std'] == pytest.approx(df['social_score'].std())
+    assert social_stats['min'] == 4.0
+    assert social_stats['max'] == 7.0
+    assert stats['communication_score']['mean'] == 4.0
+    assert all(np.isnan(value) for value in stats['behavior_score'].values())
+
+def test_calculate_summary_stats_single_assessment(sample_assessments):
+    """Test summary statistics for a single assessment."""
+    stats = calculate_summary_stats(process_assessment_data(sample_assessments[:1]))
+    
+    social_stats = stats['social_score']
+    assert social_stats['mean'] == 7.0
+    assert social_stats['median'] == 7.0
+    assert np.isnan(social_stats['std'])
+    assert social_stats['min'] == social_stats['max'] == 7.0
+
+def test_calculate_progress(sample_df):
     """Test progress calculation for a specific child."""
-    df = process_assessment_data(sample_assessments)
-    progress = calculate_progress(df, 'C001')
+    progress = calculate_progress(sample_df, 'C001')
     
     assert 'social_score' in progress
     assert 'communication_score' in progress
@@ -89,10 +131,87 @@ def test_calculate_progress(sample_assessments):
     assert social_progress['absolute_change'] == 1.0
     assert abs(social_progress['percent_change'] - 14.285714) < 0.0001
 
-def test_identify_areas_of_concern(sample_assessments):
-    """Test identification of areas of concern."""
+def test_build_assessment_index_without_child_ids(sample_assessments):
+    """Test that rows without a child id are left out of the index."""
+    df = process_assessment_data([dict(a, child_id=None) for a in sample_assessments])
+    index = build_assessment_index(df)
+    
+    assert index.first == {}
+    assert index.counts == {}
+    assert calculate_progress(index, 'C001') == {}
+
+def test_fractional_scores_are_not_rounded():
+    """Test that one-decimal scores come back exactly as entered."""
+    df = process_assessment_data([
+        {
+            'child_id': 'C001',
+            'age': 8,
+            'assessment_date': datetime(2024, 1, 1),
+            'social_score': 7.3,
+            'communication_score': 6.1,
+            'behavior_score': 8.2
+        },
+        {
+            'child_id': 'C001',
+            'age': 8,
+            'assessment_date': datetime(2024, 2, 1),
+            'social_score': 8.1,
+            'communication_score': 6.4,
+            'behavior_score': 8.9
+        }
+    ])
+    assert df['social_score'].dtype == np.float64
+    
+    progress = calculate_progress(df, 'C001')['social_score']
+    assert progress['initial_score'] == 7.3
+    assert progress['current_score'] == 8.1
+    assert progress['absolute_change'] == 8.1 - 7.3
+    assert progress['percent_change'] == (8.1 - 7.3) / 7.3 * 100
+    assert calculate_progress(build_assessment_index(df), 'C001')['social_score'] == progress
+    
+    stats = calculate_summary_stats(df)['social_score']
+    assert stats['min'] == 7.3
+    assert stats['max'] == 8.1
+    assert stats['mean'] == (7.3 + 8.1) / 2
+    
+    trends = generate_trend_data(df, 'social_score')
+    assert trends['overall'][pd.Timestamp(2024, 1, 1)] == 7.3
+    assert trends['by_age_group']['6-10'] == (7.3 + 8.1) / 2
+
+def test_calculate_progress_with_index(sample_df):
+    """Test progress calculation from a prebuilt assessment index."""
+    index = build_assessment_index(sample_df)
+    
+    assert calculate_progress(index, 'C001') == calculate_progress(sample_df, 'C001')
+    assert calculate_progress(index, 'C002') == {}
+    assert calculate_progress(index, 'C999') == {}
+
+def test_generate_trend_data_leaves_frame_unchanged(sample_assessments):
+    """Test that trend data bins ages without adding a column to the caller's frame."""
+    df = pd.DataFrame(sample_assessments)
+    original = df.copy()
+    trends = generate_trend_data(df, 'social_score')
+    
+    pd.testing.assert_frame_equal(df, original)
+    assert trends['by_age_group']['6-10'] == pytest.approx(19.0 / 3)
+
+def test_frame_fingerprint_tracks_column_contents(sample_assessments):
+    """Test that frame fingerprints change only with the fingerprinted columns."""
     df = process_assessment_data(sample_assessments)
-    concerns = identify_areas_of_concern(df, threshold=5.0)
+    columns = ['social_score', 'communication_score', 'behavior_score']
+    key = frame_fingerprint(df, columns)
+    
+    assert frame_fingerprint(df.copy(), columns) == key
+    
+    df.loc[0, 'notes'] = 'Edited'
+    assert frame_fingerprint(df, columns) == key
+    
+    df.loc[0, 'social_score'] = 10.0
+    assert frame_fingerprint(df, columns) != key
+
+def test_identify_areas_of_concern(sample_df):
+    """Test identification of areas of concern."""
+    concerns = identify_areas_of_concern(sample_df, threshold=5.0)
     
     assert len(concerns) > 0
     concern = next((c for c in concerns if c['area'] == 'communication'), None)
@@ -101,8 +220,7 @@ def test_identify_areas_of_concern(sample_assessments):
     assert concern['affected_children'] == 1
     assert concern['average_score'] == 3.0
 
-def test_identify_areas_of_concern_no_concerns(sample_assessments):
+def test_identify_areas_of_concern_no_concerns(sample_df):
     """Test identification of areas of concern with high threshold."""
-    df = process_assessment_data(sample_assessments)
-    concerns = identify_areas_of_concern(df, threshold=2.0)
+    concerns = identify_areas_of_concern(sample_df, threshold=2.0)
     assert len(concerns) == 0
\ No newline at end of file
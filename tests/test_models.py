@@ -0,0 +1,48 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+from sqlalchemy import inspect
+
+from src.database import models
+
+@pytest.fixture
+def fresh_models(tmp_path, monkeypatch):
+    """Fixture rebuilding the lazy models against a database under tmp_path."""
+    models._load()
+    monkeypatch.chdir(tmp_path)
+    for name in models._LAZY_NAMES:
+        monkeypatch.delattr(models, name)
+    monkeypatch.setattr(models, '_db_initialized', False)
+    yield models
+    models.engine.dispose()
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """Fixture providing an assessments table created before the indexes existed."""
+    (tmp_path / 'data').mkdir()
+    with closing(sqlite3.connect(tmp_path / 'data' / 'outcomes.db')) as conn:
+        conn.execute(
+            "CREATE TABLE assessments ("
+            "id INTEGER PRIMARY KEY, child_id VARCHAR(50) NOT NULL, "
+            "assessment_date DATETIME, age INTEGER NOT NULL, "
+            "social_score FLOAT, communication_score FLOAT, behavior_score FLOAT, "
+            "notes TEXT, created_at DATETIME, updated_at DATETIME)"
+        )
+        conn.commit()
+    return tmp_path / 'data' / 'outcomes.db'
+
+def test_init_db_upgrades_existing_database(fresh_models, legacy_db):
+    """Test init_db indexes an existing table, enables WAL and can run repeatedly."""
+    fresh_models.init_db()
+    fresh_models.init_db()
+    assert fresh_models._db_initialized
+    
+    indexes = {
+        index['name']
+        for index in inspect(fresh_models.engine).get_indexes('assessments')
+    }
+    assert {'ix_child_date', 'ix_assessment_date'} <= indexes
+    
+    with closing(sqlite3.connect(legacy_db)) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'